@@ -0,0 +1,85 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""C versions of the template walkers in wiktionary_define_and_collapse.py.
+
+Build in place with ``cythonize -i telegram/_wikitext.pyx``. The script falls back to its
+pure-Python walkers when the extension is not built.
+"""
+
+from cpython.unicode cimport PyUnicode_DATA, PyUnicode_KIND, PyUnicode_READ
+
+
+cdef inline bint _pair(int kind, void *data, Py_ssize_t idx, Py_ssize_t n, Py_UCS4 ch):
+    return idx + 1 < n and PyUnicode_READ(kind, data, idx) == ch and PyUnicode_READ(kind, data, idx + 1) == ch
+
+
+cdef Py_ssize_t _template_end(str text, Py_ssize_t start):
+    # Index just past the "}}" closing the template opened at start, or -1 if it never closes.
+    cdef int kind = PyUnicode_KIND(text)
+    cdef void *data = PyUnicode_DATA(text)
+    cdef Py_ssize_t n = len(text), idx = start, depth = 0
+    while idx < n:
+        if _pair(kind, data, idx, n, u"{"):
+            depth += 1
+            idx += 2
+            continue
+        if depth and _pair(kind, data, idx, n, u"}"):
+            depth -= 1
+            idx += 2
+            if depth == 0:
+                return idx
+            continue
+        idx += 1
+    return -1
+
+
+def extract_template(str text, Py_ssize_t start):
+    cdef Py_ssize_t end = _template_end(text, start)
+    if end == -1:
+        return None, None
+    return end, text[start + 2 : end - 2]
+
+
+def split_template_parts(str content):
+    cdef int kind = PyUnicode_KIND(content)
+    cdef void *data = PyUnicode_DATA(content)
+    cdef Py_ssize_t n = len(content), idx = 0, start = 0, depth = 0, link_depth = 0
+    if "{{" not in content and "[[" not in content:
+        return [p for p in (part.strip() for part in content.split("|")) if p]
+    parts = []
+    while idx < n:
+        if _pair(kind, data, idx, n, u"{"):
+            depth += 1; idx += 2; continue
+        if depth and _pair(kind, data, idx, n, u"}"):
+            depth -= 1; idx += 2; continue
+        if _pair(kind, data, idx, n, u"["):
+            link_depth += 1; idx += 2; continue
+        if link_depth and _pair(kind, data, idx, n, u"]"):
+            link_depth -= 1; idx += 2; continue
+        if depth == 0 and link_depth == 0 and PyUnicode_READ(kind, data, idx) == u"|":
+            parts.append(content[start:idx].strip())
+            start = idx + 1
+        idx += 1
+    parts.append(content[start:].strip())
+    return [p for p in parts if p]
+
+
+def expand_templates(str text, render):
+    cdef int kind = PyUnicode_KIND(text)
+    cdef void *data = PyUnicode_DATA(text)
+    cdef Py_ssize_t n = len(text), idx = 0, start = 0, end
+    out = []
+    while idx < n:
+        if _pair(kind, data, idx, n, u"{"):
+            end = _template_end(text, idx)
+            out.append(text[start:idx])
+            if end == -1:
+                # A template that never closes drops the rest of the text.
+                return "".join(out)
+            replacement = render(text[idx + 2 : end - 2])
+            if replacement:
+                out.append(replacement)
+            idx = start = end
+            continue
+        idx += 1
+    out.append(text[start:])
+    return "".join(out)
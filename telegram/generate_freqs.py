@@ -1,25 +1,52 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
 import datetime
+import http.client
+import json
+import mmap
 import os
 import re
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from urllib.error import HTTPError, URLError
 from urllib.parse import quote
-from urllib.request import Request, urlopen
 
 try:
-    from wordfreq import zipf_frequency
+    from wordfreq import get_frequency_dict, zipf_frequency
 except ImportError:
-    zipf_frequency = None
+    get_frequency_dict = zipf_frequency = None
 
-PAGEVIEWS_API_BASE = "https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article"
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+PAGEVIEWS_API_HOST = "wikimedia.org"
+PAGEVIEWS_API_PATH = "/api/rest_v1/metrics/pageviews/per-article"
+PAGEVIEWS_API_BASE = f"https://{PAGEVIEWS_API_HOST}{PAGEVIEWS_API_PATH}"
 PAGEVIEWS_USER_AGENT = "tgwordscrape/1.0"
 PAGEVIEWS_RETRY_CODES = {429, 500, 502, 503, 504}
 PAGEVIEWS_EARLIEST = "20150701"
+MASTER_READ_SIZE = 1 << 24
+PAGEVIEWS_FLUSH_EVERY = 1024
 
 def _default_pageviews_range(months, granularity):
     if months <= 0:
@@ -51,40 +78,103 @@ def _validate_yyyymmdd(value, label):
         raise ValueError(f"{label} must be in YYYYMMDD format.")
     return value
 
+_pageviews_local = threading.local()
+
+def _pageviews_connection(timeout):
+    # One keep-alive HTTPS connection per worker thread, so each word skips the TCP/TLS handshake.
+    conn = getattr(_pageviews_local, "conn", None)
+    if conn is None:
+        conn = _pageviews_local.conn = http.client.HTTPSConnection(PAGEVIEWS_API_HOST, timeout=timeout)
+    return conn
+
+def _drop_pageviews_connection():
+    conn = getattr(_pageviews_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _pageviews_local.conn = None
+
+def _total_views(body):
+    items = (orjson.loads(body) if orjson else json.loads(body)).get("items")
+    if not items: return 0
+    # Every item in the API's schema has "views"; only fall back to .get for an odd response.
+    try:
+        return int(sum([item["views"] for item in items]))
+    except KeyError:
+        return int(sum(item.get("views", 0) for item in items))
+
 def _fetch_pageviews_word(word, *, project, access, agent, granularity, start, end, timeout, retries, backoff):
     title = quote(word.replace(" ", "_"), safe="")
-    url = f"{PAGEVIEWS_API_BASE}/{project}/{access}/{agent}/{title}/{granularity}/{start}/{end}"
-    request = Request(url, headers={"User-Agent": PAGEVIEWS_USER_AGENT})
+    path = f"{PAGEVIEWS_API_PATH}/{project}/{access}/{agent}/{title}/{granularity}/{start}/{end}"
     for attempt in range(retries + 1):
         try:
-            with urlopen(request, timeout=timeout) as response:
-                import json
-                data = json.load(response)
-            items = data.get("items")
-            return int(sum(item.get("views", 0) for item in items)) if items else 0
-        except HTTPError as exc:
-            if exc.code == 404: return 0
-            if exc.code in PAGEVIEWS_RETRY_CODES and attempt < retries:
-                time.sleep(backoff * (2**attempt))
-                continue
-            return 0
+            conn = _pageviews_connection(timeout)
+            conn.request("GET", path, headers={"User-Agent": PAGEVIEWS_USER_AGENT})
+            response = conn.getresponse()
+            body = response.read()
+            if response.status != 200:
+                if response.status in PAGEVIEWS_RETRY_CODES and attempt < retries:
+                    time.sleep(backoff * (2**attempt))
+                    continue
+                return 0
+            return _total_views(body)
         except Exception:
+            # The connection may be half-closed by the server; start a fresh one on retry.
+            _drop_pageviews_connection()
             if attempt < retries:
                 time.sleep(backoff * (2**attempt))
                 continue
             return 0
     return 0
 
+async def _fetch_pageviews_word_async(get, word, *, project, access, agent, granularity, start, end, timeout, retries, backoff):
+    # `get(url, timeout)` returns (status, body) from whichever async client is driving the fetch.
+    title = quote(word.replace(" ", "_"), safe="")
+    url = f"{PAGEVIEWS_API_BASE}/{project}/{access}/{agent}/{title}/{granularity}/{start}/{end}"
+    for attempt in range(retries + 1):
+        try:
+            status, body = await get(url, timeout)
+            if status == 200:
+                return _total_views(body)
+            if status not in PAGEVIEWS_RETRY_CODES: return 0
+        except Exception:
+            pass
+        if attempt < retries: await asyncio.sleep(backoff * (2**attempt))
+    return 0
+
+async def _fetch_pageviews_async(words, workers, fetch_kwargs, on_result=None):
+    # One event loop thread drives every request. httpx (the listed requirement, with h2) multiplexes
+    # them as HTTP/2 streams over a shared TLS connection. aiohttp is only an optional fallback for
+    # environments without httpx; its connector caps how many are in flight.
+    # on_result(word, count) is called as each word finishes.
+    headers = {"User-Agent": PAGEVIEWS_USER_AGENT}
+    async def fetch(get, word):
+        count = await _fetch_pageviews_word_async(get, word, **fetch_kwargs)
+        if on_result: on_result(word, count)
+        return count
+    if httpx is not None:
+        limits = httpx.Limits(max_connections=workers, max_keepalive_connections=workers)
+        # Bound the requests in flight ourselves, so queued ones do not time out waiting for the pool.
+        in_flight = asyncio.Semaphore(workers)
+        async with httpx.AsyncClient(http2=h2 is not None, limits=limits, headers=headers) as client:
+            async def get(url, timeout):
+                async with in_flight:
+                    response = await client.get(url, timeout=timeout)
+                return response.status_code, response.content
+            counts = await asyncio.gather(*(fetch(get, word) for word in words))
+    else:
+        connector = aiohttp.TCPConnector(limit=workers, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            async def get(url, timeout):
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    return response.status, await response.read()
+            counts = await asyncio.gather(*(fetch(get, word) for word in words))
+    return dict(zip(words, counts))
+
 def fetch_pageviews(words, args, pageviews_file_path, valid_word_list=None):
-    pageviews = {}
-    
-    if pageviews_file_path.is_file():
-        print(f"Loading pageviews from {pageviews_file_path}...")
-        with pageviews_file_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                parts = line.strip().rsplit(" ", 1)
-                if len(parts) == 2:
-                    pageviews[parts[0]] = int(parts[1])
+    if pageviews_file_path.is_file(): print(f"Loading pageviews from {pageviews_file_path}...")
+    now = int(time.time())
+    zero_expires_before = now - args.pageviews_zero_ttl * 86400 if args.pageviews_zero_ttl > 0 else None
+    pageviews = load_pageviews_cache(pageviews_file_path, args.pageviews_start, args.pageviews_end, zero_expires_before)
 
     # Only fetch from API if word is in wiktionary_english_words.txt (valid_word_list)
     remaining = []
@@ -104,82 +194,147 @@ def fetch_pageviews(words, args, pageviews_file_path, valid_word_list=None):
     if remaining:
         print(f"Fetching {len(remaining)} missing words from API...")
         max_workers = max(1, min(int(args.pageviews_workers), len(remaining)))
-        new_data = {}
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_word = {
-                executor.submit(_fetch_pageviews_word, word, project=args.pageviews_project, access=args.pageviews_access,
-                                agent=args.pageviews_agent, granularity=args.pageviews_granularity, start=args.pageviews_start,
-                                end=args.pageviews_end, timeout=args.pageviews_timeout, retries=args.pageviews_retries,
-                                backoff=args.pageviews_backoff): word for word in remaining
-            }
-            for future in as_completed(future_to_word):
-                word = future_to_word[future]
-                count = future.result()
-                pageviews[word] = count
-                new_data[word] = count
-        
-        if new_data:
-            with pageviews_file_path.open("a", encoding="utf-8") as f:
-                for word, count in new_data.items():
-                    f.write(f"{word} {count}\n")
-            print(f"Added {len(new_data)} new words to {pageviews_file_path}")
+        fetch_kwargs = dict(project=args.pageviews_project, access=args.pageviews_access, agent=args.pageviews_agent,
+                            granularity=args.pageviews_granularity, start=args.pageviews_start, end=args.pageviews_end,
+                            timeout=args.pageviews_timeout, retries=args.pageviews_retries, backoff=args.pageviews_backoff)
+        # Rows are appended as results arrive, PAGEVIEWS_FLUSH_EVERY at a time with one write on an
+        # O_APPEND fd, so an interrupted run keeps everything fetched so far.
+        new_data, pending = {}, []
+        fd = os.open(pageviews_file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        def record(word, count):
+            new_data[word] = count
+            pending.append(f"{word}\t{args.pageviews_start}\t{args.pageviews_end}\t{count}\t{now}\n")
+            if len(pending) >= PAGEVIEWS_FLUSH_EVERY:
+                os.write(fd, "".join(pending).encode("utf-8"))
+                pending.clear()
+        try:
+            if httpx is not None or aiohttp is not None:
+                asyncio.run(_fetch_pageviews_async(remaining, max_workers, fetch_kwargs, record))
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    future_to_word = {executor.submit(_fetch_pageviews_word, word, **fetch_kwargs): word for word in remaining}
+                    for future in as_completed(future_to_word):
+                        record(future_to_word[future], future.result())
+        finally:
+            if pending: os.write(fd, "".join(pending).encode("utf-8"))
+            os.fsync(fd)
+            os.close(fd)
+        pageviews.update(new_data)
+        if new_data: print(f"Added {len(new_data)} new words to {pageviews_file_path}")
     
     return pageviews
 
 def load_wordlist(path):
-    if not path or not Path(path).is_file(): return set()
-    return {line.strip().lower() for line in Path(path).open(encoding="utf-8") if line.strip() and not line.startswith("#")}
+    if not path: return set()
+    path = Path(path)
+    if not path.is_file(): return set()
+    # Lowercase the whole file in one C pass rather than once per line. str.lower (not bytes.lower)
+    # so non-ASCII words fold the same way as before.
+    # Interned, so the scraped words, both reference lists and the master-frequency keys share one
+    # object per word and membership checks hit the identity fast path.
+    words = {sys.intern(line.strip()) for line in path.read_text(encoding="utf-8").lower().split("\n") if not line.startswith("#")}
+    words.discard("")
+    return words
 
-def load_master_frequency(path):
+def load_master_frequency(path, wanted=None):
+    # The master list has ~7.9M rows but only scraped words are ever looked up; when `wanted` is
+    # given, every other row is skipped before its count is parsed or a dict entry is made.
+    # The file is mapped rather than read, and decoded and lowercased in large blocks cut at line
+    # ends; each row is then split once from the right instead of fully split and re-joined.
     freqs = {}
-    if not path or not Path(path).is_file(): return freqs
-    with Path(path).open(encoding="utf-8") as f:
-        for line in f:
-            parts = line.strip().split()
-            if len(parts) >= 2:
-                word = " ".join(parts[:-1])
-                count = parts[-1]
+    if not path: return freqs
+    path = Path(path)
+    if not path.is_file() or not path.stat().st_size: return freqs
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos, size = 0, len(mm)
+        while pos < size:
+            cut = mm.rfind(b"\n", pos, pos + MASTER_READ_SIZE) + 1 if pos + MASTER_READ_SIZE < size else size
+            if cut <= pos: cut = mm.find(b"\n", pos) + 1 or size
+            text = mm[pos:cut].decode("utf-8").lower()
+            # Bare "\r" ends a line too, as it did under the text-mode reader.
+            if "\r" in text: text = text.replace("\r", "\n")
+            for line in text.split("\n"):
+                parts = line.rsplit(None, 1)
+                if len(parts) != 2: continue
+                word, count = parts
+                # Multi-word rows (and stray whitespace) collapse to single spaces, as before.
+                if not word.isalnum(): word = " ".join(word.split())
+                if wanted is not None and word not in wanted: continue
                 try:
-                    freqs[word.lower()] = int(count)
+                    freqs[sys.intern(word)] = int(count)
                 except ValueError: continue
+            pos = cut
     return freqs
 
-def load_pageviews_cache(pageviews_file_path):
+def load_pageviews_cache(pageviews_file_path, start, end, zero_expires_before=None):
+    # Rows are "word<TAB>start<TAB>end<TAB>count[<TAB>fetched_at]", so totals for different
+    # --pageviews-months ranges live side by side and only the requested range is loaded.
+    # Full-history rows (start == PAGEVIEWS_EARLIEST), including legacy "word count" rows, are
+    # reused for any end date: the default range ends with last month, and refetching everything
+    # every month just to add one month of views is not worth the API traffic. Zero counts fetched
+    # before `zero_expires_before` (epoch seconds) are left out so they get fetched again; a 404
+    # today may be a real page next month.
     pageviews = {}
+    full_history = start == PAGEVIEWS_EARLIEST
     if pageviews_file_path.is_file():
         with pageviews_file_path.open("r", encoding="utf-8") as f:
             for line in f:
-                parts = line.strip().rsplit(" ", 1)
-                if len(parts) == 2:
-                    try:
-                        pageviews[parts[0]] = int(parts[1])
-                    except ValueError: continue
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) in (4, 5):
+                    if parts[1] != start or (parts[2] != end and not full_history): continue
+                    word, count = parts[0], parts[3]
+                    if zero_expires_before and count == "0" and len(parts) == 5:
+                        try:
+                            if int(parts[4]) < zero_expires_before:
+                                pageviews.pop(word, None)
+                                continue
+                        except ValueError: pass
+                elif full_history and len(parts := line.strip().rsplit(" ", 1)) == 2:
+                    word, count = parts
+                else: continue
+                try:
+                    pageviews[word] = int(count)
+                except ValueError: continue
     return pageviews
 
+_zipf_freqs = None
+_zipf_cache = {}
+
+def _zipf(word):
+    # zipf_frequency(word, "en"), computed once per word. A plain lowercase ASCII word is its own single
+    # token, so when it is missing from wordfreq's English table it scores 0 without being tokenized.
+    z = _zipf_cache.get(word)
+    if z is None:
+        global _zipf_freqs
+        if zipf_frequency is None:
+            z = 0.0
+        else:
+            if _zipf_freqs is None: _zipf_freqs = get_frequency_dict("en", "best")
+            if word not in _zipf_freqs and word.isascii() and word.isalpha() and word.islower(): z = 0.0
+            else: z = zipf_frequency(word, "en")
+        _zipf_cache[word] = z
+    return z
+
 def write_discarded_log(discarded_words, master_freqs, log_path):
     if not discarded_words: return
     
-    # Sort by G_MASTER asc, then ZIPF asc, then word asc
-    sorted_discarded = sorted(
-        discarded_words,
-        key=lambda w: (
-            master_freqs.get(w, 0),
-            zipf_frequency(w, "en") if zipf_frequency else 0.0,
-            w
-        )
+    # Sort by G_MASTER asc, then ZIPF asc, then word asc. The rows are the sort keys themselves, so
+    # each word's frequency and zipf lookup happen once and are reused when the row is written.
+    rows = sorted(
+        (master_freqs.get(w, 0), _zipf(w), w)
+        for w in discarded_words
     )
     
-    max_word_len = max([len(w) for w in sorted_discarded] + [4])
+    max_word_len = max([len(w) for _, _, w in rows] + [4])
     header = f"{ 'WORD':<{max_word_len}}  {'G_MASTER':>15}  {'ZIPF':>10}"
     sep = f"{'-'*max_word_len}  {'-'*15}  {'-'*10}"
-    lines = [header, sep]
-    
-    for w in sorted_discarded:
-        zipf = zipf_frequency(w, "en") if zipf_frequency else 0.0
-        g_freq = master_freqs.get(w, 0)
-        lines.append(f"{w:<{max_word_len}}  {g_freq:>15d}  {zipf:>10.6f}")
     
-    Path(log_path).write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with Path(log_path).open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(f"{header}\n{sep}\n")
+        # The column widths are fixed, so the row format is parsed once rather than once per row.
+        row = ("{2:<%d}  {0:>15d}  {1:>10.6f}\n" % max_word_len).format
+        for r in rows:
+            f.write(row(*r))
 
 def main():
     script_dir = Path(__file__).parent
@@ -214,6 +369,8 @@ def main():
     parser.add_argument("--pageviews-timeout", type=float, default=10.0)
     parser.add_argument("--pageviews-retries", type=int, default=2)
     parser.add_argument("--pageviews-backoff", type=float, default=0.5)
+    parser.add_argument("--pageviews-zero-ttl", type=float, default=30.0,
+                        help="Days before a cached 0-view count is fetched again (0 keeps zeros forever).")
     
     args = parser.parse_args()
     
@@ -229,13 +386,14 @@ def main():
     print(f"Loaded {len(scraped_words)} unique words from {args.input}")
 
     print(f"Loading Master Google Ngram frequencies (7.9M words)...")
-    master_freqs = load_master_frequency(args.master_list)
+    master_freqs = load_master_frequency(args.master_list, scraped_words)
     w_list = load_wordlist(args.wiktionary_list)
     n_list = load_wordlist(args.wordnet_list)
-    pv_cache = load_pageviews_cache(Path(args.pageviews_file))
+    pv_cache = load_pageviews_cache(Path(args.pageviews_file), args.pageviews_start, args.pageviews_end)
 
     final_words = set()
     discarded_words = set()
+    pending_api = set()
 
     # Determine which filters are active
     active_filters = {
@@ -257,29 +415,26 @@ def main():
         print(f"Mode: Filtering. Active criteria: {', '.join(filter_names)}")
         if args.strict: print("Strict mode enabled: API checks disabled for unknown words.")
 
-        for w in scraped_words:
-            is_valid = False
-            
-            if active_filters["wiki"] and w in w_list:
-                is_valid = True
-            elif active_filters["wordnet"] and w in n_list:
-                is_valid = True
-            elif active_filters["zipf"] and zipf_frequency and zipf_frequency(w, "en") > 0:
-                is_valid = True
-            elif active_filters["ngram"] and master_freqs.get(w, 0) > 0:
-                is_valid = True
-            elif active_filters["pageviews"] and pv_cache.get(w, 0) > 0:
-                is_valid = True
-            
-            # If not in local lists but we want to check pageviews API
-            if not is_valid and active_filters["pageviews"] and not args.strict:
-                # We'll include it for the API fetch later
-                is_valid = True
-            
-            if is_valid:
-                final_words.add(w)
-            else:
-                discarded_words.add(w)
+        # Cheapest checks first, as set operations; each later check only sees words still unmatched,
+        # so the per-word zipf lookups run on the small remainder.
+        if active_filters["wiki"]: final_words |= scraped_words & w_list
+        if active_filters["wordnet"]: final_words |= scraped_words & n_list
+        remaining = scraped_words - final_words
+        if active_filters["ngram"]:
+            final_words |= {w for w in remaining & master_freqs.keys() if master_freqs[w] > 0}
+        if active_filters["pageviews"]:
+            final_words |= {w for w in remaining & pv_cache.keys() if pv_cache[w] > 0}
+        remaining -= final_words
+        if active_filters["zipf"] and zipf_frequency:
+            final_words |= {w for w in remaining if _zipf(w) > 0}
+            remaining -= final_words
+        
+        # If not in local lists but we want to check pageviews API, include it for the API fetch later
+        if active_filters["pageviews"] and not args.strict:
+            pending_api = remaining
+            final_words |= remaining
+        else:
+            discarded_words = remaining
 
     print(f"Final word count: {len(final_words)}")
     print(f"Discarded count: {len(discarded_words)}")
@@ -290,58 +445,40 @@ def main():
 
     pageviews = fetch_pageviews(final_words, args, Path(args.pageviews_file), valid_word_list=w_list)
     
-    # Post-fetch filtering: if it was only included for checking and it has 0 pageviews
-    # AND it's not in any other active local lists, we discard it now.
+    # Post-fetch filtering: words that were only included for the API check are discarded if they
+    # still have 0 pageviews. Every other word already passed a local check, so it is not re-tested.
     if not args.all:
-        filtered_final = []
-        for w in final_words:
-            keep = False
-            if active_filters["wiki"] and w in w_list: keep = True
-            elif active_filters["wordnet"] and w in n_list: keep = True
-            elif active_filters["zipf"] and (zipf_frequency and zipf_frequency(w, "en") > 0): keep = True
-            elif active_filters["ngram"] and master_freqs.get(w, 0) > 0: keep = True
-            elif active_filters["pageviews"] and pageviews.get(w, 0) > 0: keep = True
-            
-            if keep:
-                filtered_final.append(w)
-            else:
-                discarded_words.add(w)
+        unviewed = {w for w in pending_api if pageviews.get(w, 0) <= 0}
+        discarded_words |= unviewed
         
-        if len(filtered_final) != len(final_words):
-            print(f"Post-fetch filtering: {len(final_words) - len(filtered_final)} words removed for 0 pageviews.")
+        if unviewed:
+            print(f"Post-fetch filtering: {len(unviewed)} words removed for 0 pageviews.")
             # Update discarded words file if needed
-            if discarded_words:
-                write_discarded_log(discarded_words, master_freqs, args.discarded)
+            write_discarded_log(discarded_words, master_freqs, args.discarded)
         
-        final_words_list = filtered_final
+        final_words_list = final_words - unviewed
     else:
         final_words_list = list(final_words)
 
-    sorted_words = sorted(
-        final_words_list, 
-        key=lambda w: (master_freqs.get(w, 0), pageviews.get(w, 0), w), 
-        reverse=False
-    )
+    # Decorated rows: sorted by (G_MASTER, PAGEVIEWS, word) and reused for the output columns.
+    rows = sorted((master_freqs.get(w, 0), pageviews.get(w, 0), w) for w in final_words_list)
 
     output_path = Path(args.output)
-    if not sorted_words:
+    if not rows:
         print("No words left after filtering. Output not written.")
         return 0
 
-    max_word_len = max([len(w) for w in sorted_words] + [4])
+    max_word_len = max([len(w) for _, _, w in rows] + [4])
     header = f"{ 'WORD':<{max_word_len}}  {'IN_WIKI':>7}  {'G_MASTER':>15}  {'PAGEVIEWS':>10}  {'ZIPF':>10}"
     sep = f"{'-'*max_word_len}  {'-'*7}  {'-'*15}  {'-'*10}  {'-'*10}"
-    lines = [header, sep]
-    
-    for w in sorted_words:
-        in_wiki = "YES" if w in w_list else "NO"
-        zipf = zipf_frequency(w, "en") if zipf_frequency else 0.0
-        g_freq = master_freqs.get(w, 0)
-        p_views = pageviews.get(w, 0)
-        lines.append(f"{w:<{max_word_len}}  {in_wiki:>7}  {g_freq:>15d}  {p_views:>10d}  {zipf:>10.6f}")
     
-    output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-    print(f"Wrote {len(sorted_words)} words to {output_path}")
+    # Rows go straight into a 1 MiB write buffer instead of one list and one joined string.
+    with output_path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(f"{header}\n{sep}\n")
+        row = ("{:<%d}  {:>7}  {:>15d}  {:>10d}  {:>10.6f}\n" % max_word_len).format
+        for g_freq, p_views, w in rows:
+            f.write(row(w, "YES" if w in w_list else "NO", g_freq, p_views, _zipf(w)))
+    print(f"Wrote {len(rows)} words to {output_path}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,14 +6,24 @@ import json
 import os
 import re
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from html.parser import HTMLParser
 from pathlib import Path
 from urllib.parse import unquote, urlparse
 
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
 IMAGE_EXTENSIONS = {".bmp", ".gif", ".jpeg", ".jpg", ".png", ".tif", ".tiff", ".webp"}
 WORD_RE = re.compile(r"\b\w+(?:['\w]+)?\b")
 REPEATED_CHAR_RE = re.compile(r"(.)\1\1")
+# Same selection as TelegramHTMLParser: text inside both a div.message and a div.text, and the
+# links/images anywhere inside a div.message.
+_DIV_CLASS = "ancestor::div[contains(concat(' ', normalize-space(@class), ' '), ' %s ')]"
+MESSAGE_TEXT_XPATH = f"//text()[{_DIV_CLASS % 'message'} and {_DIV_CLASS % 'text'}]"
+MESSAGE_MEDIA_XPATH = f"(//a | //img)[{_DIV_CLASS % 'message'}]"
 
 class TelegramHTMLParser(HTMLParser):
     def __init__(self) -> None:
@@ -55,7 +65,8 @@ class TelegramHTMLParser(HTMLParser):
             if stripped: self.text_chunks.append(stripped)
 
 def extract_words_from_text(text):
-    return {match.lower() for match in WORD_RE.findall(text)}
+    # Lowercase each match, not the text: lowering first can split a word (e.g. "İ" gains a combining dot).
+    return set(map(str.lower, WORD_RE.findall(text)))
 
 def resolve_image_paths(image_refs, html_path):
     resolved = []
@@ -68,15 +79,33 @@ def resolve_image_paths(image_refs, html_path):
         if path.suffix.lower() in IMAGE_EXTENSIONS and path.is_file(): resolved.append(path)
     return resolved
 
-def load_messages_and_images(chat_dir):
+def _parse_html_file(html_path):
+    # Runs in a worker process; images are resolved there so only text and paths come back.
+    if lxml_html is not None:
+        # libxml2 builds the tree and the XPath picks the nodes in C, instead of a Python callback per tag.
+        data = html_path.read_bytes()
+        if not data.strip(): return [], []
+        root = lxml_html.fromstring(data, parser=lxml_html.HTMLParser(encoding="utf-8"))
+        text_chunks = [t for t in (node.strip() for node in root.xpath(MESSAGE_TEXT_XPATH, smart_strings=False)) if t]
+        image_refs = [el.get(key) for el in root.xpath(MESSAGE_MEDIA_XPATH) for key in ("href", "src") if key in el.attrib]
+        return text_chunks, resolve_image_paths(image_refs, html_path)
+    parser = TelegramHTMLParser()
+    parser.feed(html_path.read_text(encoding="utf-8"))
+    return parser.text_chunks, resolve_image_paths(parser.image_refs, html_path)
+
+def load_messages_and_images(chat_dir, workers=1):
     html_files = sorted(Path(chat_dir).glob("messages*.html"))
     if not html_files: raise FileNotFoundError(f"No messages*.html found in {chat_dir}")
     all_texts, all_images = [], set()
-    for html_path in html_files:
-        parser = TelegramHTMLParser()
-        parser.feed(html_path.read_text(encoding="utf-8"))
-        all_texts.extend(parser.text_chunks)
-        all_images.update(resolve_image_paths(parser.image_refs, html_path))
+    workers = max(1, min(int(workers), len(html_files)))
+    # HTMLParser is pure Python, so the export's files are parsed in separate processes, not threads.
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor: results = list(executor.map(_parse_html_file, html_files))
+    else:
+        results = map(_parse_html_file, html_files)
+    for texts, images in results:
+        all_texts.extend(texts)
+        all_images.update(images)
     return all_texts, sorted(all_images)
 
 def _ocr_image_words(image_path, lang, min_confidence):
@@ -84,30 +113,39 @@ def _ocr_image_words(image_path, lang, min_confidence):
     import pytesseract
     with Image.open(image_path) as image:
         ocr_data = pytesseract.image_to_data(image, lang=lang, output_type=pytesseract.Output.DICT)
-    words = set()
-    sources = {}
+    kept = []
     for raw_text, confidence in zip(ocr_data.get("text", []), ocr_data.get("conf", [])):
         if not raw_text or not raw_text.strip(): continue
         try: conf = float(confidence)
         except: conf = 0
         if min_confidence > 0 and conf < min_confidence: continue
-        for match in WORD_RE.findall(raw_text):
-            word = match.lower()
-            words.add(word)
-            sources.setdefault(word, set()).add(str(image_path))
-    return words, sources
+        kept.append(raw_text)
+    words = extract_words_from_text("\n".join(kept))
+    return words, {word: {str(image_path)} for word in words}
+
+def _limit_ocr_threads():
+    # Pool initializer: each image already gets its own tesseract process, so stop every one of them
+    # also spreading over all cores with OpenMP; the pool supplies the parallelism.
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
 
 def ocr_images(image_paths, lang, min_confidence, workers):
     import pytesseract
     ocr_words, word_sources = set(), {}
-    with ThreadPoolExecutor(max_workers=max(1, int(workers))) as executor:
-        future_map = {executor.submit(_ocr_image_words, p, lang, min_confidence): p for p in image_paths}
-        for future in as_completed(future_map):
-            try:
-                words, sources = future.result()
-                ocr_words.update(words)
-                for w, paths in sources.items(): word_sources.setdefault(w, set()).update(paths)
-            except Exception as e: print(f"Warning: OCR failed for {future_map[future]}: {e}")
+    def collect(image_path, result):
+        try: words, sources = result()
+        except Exception as e:
+            print(f"Warning: OCR failed for {image_path}: {e}")
+            return
+        ocr_words.update(words)
+        for w, paths in sources.items(): word_sources.setdefault(w, set()).update(paths)
+    workers = max(1, min(int(workers), len(image_paths)))
+    # Worker processes (not threads) keep the image loading and TSV parsing in pytesseract off a shared GIL.
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_limit_ocr_threads) as executor:
+            future_map = {executor.submit(_ocr_image_words, p, lang, min_confidence): p for p in image_paths}
+            for future in as_completed(future_map): collect(future_map[future], future.result)
+    else:
+        for p in image_paths: collect(p, lambda p=p: _ocr_image_words(p, lang, min_confidence))
     return ocr_words, word_sources
 
 def parse_args():
@@ -119,15 +157,16 @@ def parse_args():
     parser.add_argument("--ocr-lang", default="eng")
     parser.add_argument("--ocr-min-confidence", type=float, default=60.0)
     parser.add_argument("--ocr-workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--html-workers", type=int, default=os.cpu_count() or 4)
     parser.add_argument("--ocr-map-output", default=str(script_dir / "ocr_word_map.json"))
     return parser.parse_args()
 
 def main():
     args = parse_args()
-    try: texts, images = load_messages_and_images(args.chat_dir)
+    try: texts, images = load_messages_and_images(args.chat_dir, args.html_workers)
     except Exception as e: print(e); return 1
-    words = set()
-    for t in texts: words.update(extract_words_from_text(t))
+    # One regex scan over all chunks; a newline can never sit inside a match, so nothing joins up.
+    words = extract_words_from_text("\n".join(texts))
     ocr_sources = {}
     if not args.skip_ocr and images:
         ocr_words, ocr_sources = ocr_images(images, args.ocr_lang, args.ocr_min_confidence, args.ocr_workers)
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 import argparse
+import mmap
 import re
 from pathlib import Path
 
-TITLE_WORD_RE = re.compile(r"^[A-Za-z]+$")
+# A whole line of letters, tolerating the surrounding whitespace str.strip() used to drop; \r and \n
+# both end a line, as they did when the file was read in text mode.
+TITLE_WORD_RE = re.compile(
+    rb"(?<![^\r\n])[ \t\f\v\x1c-\x1f]*([A-Za-z]+)[ \t\f\v\x1c-\x1f]*(?![^\r\n])"
+)
 
 
 def parse_args():
@@ -33,16 +38,17 @@ def main():
         raise SystemExit(f"Titles file not found: {titles_path}")
 
     words = set()
-    with titles_path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            title = line.strip()
-            if not title:
-                continue
-            if TITLE_WORD_RE.match(title):
-                words.add(title.lower())
-
+    if titles_path.stat().st_size:
+        # One C-level regex scan over the mapped file instead of a Python loop per title.
+        with titles_path.open("rb") as handle, mmap.mmap(
+            handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as titles:
+            words = {match.group(1).lower() for match in TITLE_WORD_RE.finditer(titles)}
+
+    # Titles are pure ASCII, so the bytes sort matches the str sort and nothing needs decoding.
     output_path = Path(args.output)
-    output_path.write_text("\n".join(sorted(words)) + "\n", encoding="utf-8")
+    with output_path.open("wb") as output:
+        output.writelines(word + b"\n" for word in sorted(words))
     print(f"Wrote {len(words)} words to {output_path}")
     return 0
 
@@ -7,8 +7,14 @@ import urllib.request
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 ENGLISH_LINE_RE = re.compile(r"(?m)^\s*==English==\s*$")
 CHUNK_SIZE = 8 * 1024 * 1024
+ROOT_CLEAR_INTERVAL = 10_000
 
 
 def parse_args():
@@ -73,33 +79,49 @@ def download_dump(url, dest_path):
     tmp_path.replace(dest_path)
 
 
-def _localname(tag):
-    if "}" in tag:
-        return tag.split("}", 1)[1]
-    return tag
+def _page_tags(tag):
+    # Every element shares the dump's one export namespace ("{http://www.mediawiki.org/xml/export-0.11/}"),
+    # so the qualified tag names are built once and compared directly instead of stripping each tag.
+    ns = tag[: tag.find("}") + 1]
+    return tuple(ns + name for name in ("page", "title", "ns", "revision", "text"))
 
 
 def iter_pages(xml_stream):
-    context = ET.iterparse(xml_stream, events=("end",))
-    for _, elem in context:
-        if _localname(elem.tag) != "page":
+    if lxml_etree is not None:
+        # libxml2 filters on the page tag itself, so Python only wakes up once per page.
+        context = lxml_etree.iterparse(
+            xml_stream, events=("end",), tag="{*}page", huge_tree=True
+        )
+        tags = None
+    else:
+        # Grab <mediawiki> from its start event so finished pages can be dropped from it in batches.
+        context = ET.iterparse(xml_stream, events=("start", "end"))
+        _, root = next(context)
+        tags = _page_tags(root.tag)
+    pages = 0
+    for event, elem in context:
+        if tags is None:
+            tags = _page_tags(elem.tag)
+        page_tag, title_tag, ns_tag, revision_tag, text_tag = tags
+        if event != "end" or elem.tag != page_tag:
             continue
-        title = None
-        revision = None
-        for child in elem:
-            local = _localname(child.tag)
-            if local == "title":
-                title = child.text or ""
-            elif local == "revision":
-                revision = child
+        title = elem.findtext(title_tag)
+        namespace = elem.findtext(ns_tag)
+        revision = elem.find(revision_tag)
         text = None
-        if revision is not None:
-            for child in revision:
-                if _localname(child.tag) == "text":
-                    text = child.text or ""
-                    break
+        # Only main-namespace pages are dictionary entries; skip Template:, User:, Appendix:, ...
+        if revision is not None and namespace in (None, "0"):
+            text = revision.findtext(text_tag)
         yield title, text
         elem.clear()
+        if lxml_etree is not None:
+            # Drop the cleared pages still hanging off <mediawiki> so memory stays flat.
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        else:
+            pages += 1
+            if pages % ROOT_CLEAR_INTERVAL == 0:
+                del root[:]
 
 
 def open_dump(path):
@@ -72,8 +72,15 @@ def main():
         print("Loading existing progress...")
         with output_path.open("r", encoding="utf-8") as f:
             for line in f:
-                parts = line.strip().rsplit(" ", 1)
-                if len(parts) == 2:
+                # "word<TAB>start<TAB>end<TAB>count[<TAB>fetched_at]" rows (shared with generate_freqs.py)
+                # or legacy "word count" rows, which were all fetched over the full history. Any
+                # full-history row counts as finished whatever its end date, so a new month does not
+                # restart the whole scrape.
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) in (4, 5):
+                    if parts[1] == START_DATE:
+                        finished_words[parts[0]] = parts[3]
+                elif len(parts := line.strip().rsplit(" ", 1)) == 2:
                     finished_words[parts[0]] = parts[1]
     
     # Load targets
@@ -106,7 +113,7 @@ def main():
                 for future in as_completed(futures):
                     word, count = future.result()
                     with file_lock:
-                        out_f.write(f"{word} {count}\n")
+                        out_f.write(f"{word}\t{START_DATE}\t{END_DATE}\t{count}\n")
                         out_f.flush()
                     if pbar:
                         pbar.update(1)